@@ -1,12 +1,19 @@
 import atexit
+import concurrent.futures
+import hashlib
 import importlib.resources
 import os
+import select
+import shlex
+import shutil
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import redis
 import requests
@@ -24,15 +31,113 @@ def is_colab_environment():
         return False
 
 
+def _resolve_compose_file():
+    try:
+        # Try to find the docker-compose.yml file in the package
+        compose_file = importlib.resources.files("ready_redis") / "docker-compose.yml"
+    except ImportError:
+        # Fallback for development mode
+        current_dir = Path(__file__).parent.absolute()
+        project_root = current_dir.parent
+        compose_file = project_root / "docker-compose.yml"
+
+    compose_file = Path(compose_file)
+    if not compose_file.is_file():
+        raise FileNotFoundError(f"docker-compose.yml not found at {compose_file}")
+    return compose_file
+
+
+_COMPOSE_FILE = _resolve_compose_file()
+_PUSH_READY_COMPOSE_FILE = _COMPOSE_FILE.parent / "docker-compose.push-ready.yml"
+
+
+def _pull_image(image):
+    try:
+        subprocess.run(
+            ["docker", "pull", image],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        # Docker is unavailable; compose will report the real error later
+        pass
+
+
+def _start_prepull():
+    # READY_REDIS_PREPULL=1 pulls "latest"; any other value is used as the tag
+    version = os.getenv("READY_REDIS_PREPULL")
+    if not version or is_colab_environment():
+        return None
+    if version == "1":
+        version = "latest"
+
+    thread = threading.Thread(
+        target=_pull_image, args=(f"redis/redis-stack:{version}",), daemon=True
+    )
+    thread.start()
+    return thread
+
+
+_PREPULL_THREAD = _start_prepull()
+
+
+def _wait_ready(host, port, password=None, timeout=30):
+    """Block until the Redis server at (host, port) answers PING.
+
+    Polls with an exponential backoff (10ms up to 250ms) instead of sleeping
+    for a fixed amount of time. Raises TimeoutError if the server is not
+    ready within ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                pass
+            with redis.Redis(
+                host=host,
+                port=port,
+                password=password,
+                socket_timeout=0.2,
+                socket_connect_timeout=0.2,
+            ) as probe:
+                if probe.ping():
+                    return
+        except (OSError, redis.exceptions.RedisError):
+            pass
+
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Redis at {host}:{port} not ready after {timeout} seconds"
+            )
+        time.sleep(min(0.25, 0.01 * 1.5**attempt))
+        attempt += 1
+
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class ColabRedis:
     REDIS_STACK_VERSION = "7.2.0-v2"
     REDIS_STACK_IMAGE = f"redis-stack-server-{REDIS_STACK_VERSION}-x86_64.AppImage"
     REDIS_STACK_URL = f"https://packages.redis.io/redis-stack/{REDIS_STACK_IMAGE}"
+    REDIS_STACK_SHA256: Optional[str] = None
 
     def __init__(self, port, redis_args):
         self.port = port
         self.redis_args = redis_args
         self.process = None
+        self.sha256 = os.getenv("READY_REDIS_STACK_SHA256", self.REDIS_STACK_SHA256)
+        cache_dir = os.getenv("READY_REDIS_CACHE_DIR")
+        if cache_dir is None:
+            cache_home = os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+            cache_dir = os.path.join(cache_home, "ready-redis")
+        self.image_path = Path(cache_dir) / self.REDIS_STACK_IMAGE
 
     def start(self):
         print(
@@ -48,32 +153,65 @@ class ColabRedis:
             raise
 
     def _download_redis_stack(self):
-        response = requests.get(self.REDIS_STACK_URL, stream=True)
-        total_size = int(response.headers.get("content-length", 0))
-
-        with open(self.REDIS_STACK_IMAGE, "wb") as file, tqdm(
-            desc="Downloading Redis Stack",
-            total=total_size,
-            unit="iB",
-            unit_scale=True,
-            unit_divisor=1024,
-        ) as progress_bar:
-            for data in response.iter_content(chunk_size=1024):
-                size = file.write(data)
-                progress_bar.update(size)
+        if self._cached_image_valid():
+            print(f"Using cached Redis Stack image at {self.image_path}")
+            return
+
+        self.image_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = self.image_path.with_suffix(".part")
+
+        with requests.get(self.REDIS_STACK_URL, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = False
+            total_size = int(response.headers.get("content-length", 0))
+
+            with open(partial_path, "wb") as file, tqdm.wrapattr(
+                response.raw,
+                "read",
+                total=total_size,
+                desc="Downloading Redis Stack",
+            ) as raw:
+                shutil.copyfileobj(raw, file, length=1024 * 1024)
+
+        if self.sha256 and _file_sha256(partial_path) != self.sha256:
+            partial_path.unlink()
+            raise Exception(f"Checksum mismatch for {self.REDIS_STACK_URL}")
+
+        os.replace(partial_path, self.image_path)
+
+    def _cached_image_valid(self):
+        if not self.image_path.is_file():
+            return False
+        if self.sha256:
+            return _file_sha256(self.image_path) == self.sha256
+
+        try:
+            head = requests.head(self.REDIS_STACK_URL, allow_redirects=True, timeout=10)
+        except requests.RequestException:
+            # Offline: downloads are only renamed into place once complete
+            return True
+        if not head.ok:
+            # The server cannot confirm the size; trust the cache as when offline
+            return True
+        expected_size = int(head.headers.get("content-length", 0))
+        return expected_size > 0 and self.image_path.stat().st_size == expected_size
 
     def _install_and_run_redis_stack(self):
-        commands = [
-            f"chmod a+x {self.REDIS_STACK_IMAGE}",
-            f"./{self.REDIS_STACK_IMAGE} --port {self.port} {self.redis_args} --daemonize yes",
-            "sleep 2",
+        os.chmod(self.image_path, 0o755)
+        cmd = [
+            str(self.image_path),
+            "--port",
+            str(self.port),
+            *shlex.split(self.redis_args),
+            "--daemonize",
+            "yes",
         ]
-
-        for cmd in tqdm(commands, desc="Setting up Redis Stack"):
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise Exception(f"Command failed: {cmd}\nError: {result.stderr}")
-            time.sleep(0.5)  # Add a small delay to make the progress bar more visible
+        # The server daemonizes, so this returns as soon as it has forked
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise Exception(
+                f"Command failed: {shlex.join(cmd)}\nError: {result.stderr}"
+            )
 
     def stop(self):
         if self.process:
@@ -83,26 +221,29 @@ class ColabRedis:
 
 class ReadyRedis:
     _instances: Dict[Tuple, "ReadyRedis"] = {}
+    _pools: Dict[Tuple, redis.ConnectionPool] = {}
+    _pool_users: Dict[Tuple, int] = {}
+    _lock = threading.RLock()
+    _reused_stacks: List[Tuple[DockerCompose, str]] = []
 
     @classmethod
     def get(
         cls,
         name: str = "ready-redis",
         redis_container_name: Optional[str] = None,
-        host: str = "localhost",
+        host: str = "127.0.0.1",
         port: int = 6379,
         db: int = 0,
         password: Optional[str] = None,
         protocol: int = 3,
         redis_version: str = "latest",
         redis_args: str = "--save '' --appendonly no",
+        use_push_readiness: bool = False,
+        reuse: bool = False,
     ):
-        if redis_container_name is None:
-            redis_container_name = f"redis-stack-{str(ULID())}"
-
+        reuse = reuse or os.getenv("READY_REDIS_REUSE") == "1"
         config = (
             name,
-            redis_container_name,
             host,
             port,
             db,
@@ -111,19 +252,33 @@ class ReadyRedis:
             redis_version,
             redis_args,
         )
-        if config not in cls._instances:
-            cls._instances[config] = cls(
-                name,
-                redis_container_name,
-                host,
-                port,
-                db,
-                password,
-                protocol,
-                redis_version,
-                redis_args,
-            )
-        return cls._instances[config]
+        instance = cls._instances.get(config)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(config)
+                if instance is None:
+                    if redis_container_name is None and reuse:
+                        # Deterministic name so later runs find the container
+                        digest = hashlib.sha1(repr(config).encode()).hexdigest()
+                        redis_container_name = f"ready-redis-{digest[:12]}"
+                    elif redis_container_name is None:
+                        redis_container_name = f"redis-stack-{str(ULID())}"
+                    instance = cls(
+                        name,
+                        redis_container_name,
+                        host,
+                        port,
+                        db,
+                        password,
+                        protocol,
+                        redis_version,
+                        redis_args,
+                        use_push_readiness=use_push_readiness,
+                        reuse=reuse,
+                    )
+                    instance._config = config
+                    cls._instances[config] = instance
+        return instance
 
     def __init__(
         self,
@@ -136,6 +291,8 @@ class ReadyRedis:
         protocol: int,
         redis_version: str,
         redis_args: str,
+        use_push_readiness: bool = False,
+        reuse: bool = False,
     ):
         self._name = name
         self._redis_container_name = redis_container_name
@@ -146,24 +303,56 @@ class ReadyRedis:
         self._protocol = protocol
         self._redis_version = redis_version
         self._redis_args = redis_args
+        self._use_push_readiness = use_push_readiness
+        self._reuse = reuse
         self._compose = None
-        self._env_file = None
+        self._env_file_path = None
+        self._ready_fifo_dir = None
+        self._ready_fifo_fd = None
         self._cleaned_up = False
         self._colab_redis = None
+        self._pool_key = None
+        self._config = None
+        self._atexit_registered = False
 
         if is_colab_environment():
             self._start_colab_redis()
         else:
             self._start_redis_container()
 
-        self._client = redis.Redis(
-            host=self._host,
-            port=self._port,
-            db=self._db,
-            password=self._password,
-            protocol=self._protocol,
+        _wait_ready(self._host, self._port, self._password)
+
+        pool_key = (
+            self._host,
+            self._port,
+            self._db,
+            self._password,
+            self._protocol,
         )
-        atexit.register(self.cleanup)
+        with ReadyRedis._lock:
+            pool = ReadyRedis._pools.get(pool_key)
+            if pool is None:
+                pool_kwargs = dict(
+                    host=self._host,
+                    port=self._port,
+                    db=self._db,
+                    password=self._password,
+                    protocol=self._protocol,
+                )
+                max_connections = os.getenv("READY_REDIS_MAX_CONN")
+                if max_connections:
+                    # Callers wait for a free connection instead of erroring
+                    pool = redis.BlockingConnectionPool(
+                        max_connections=int(max_connections), **pool_kwargs
+                    )
+                else:
+                    pool = redis.ConnectionPool(**pool_kwargs)
+                ReadyRedis._pools[pool_key] = pool
+            ReadyRedis._pool_users[pool_key] = (
+                ReadyRedis._pool_users.get(pool_key, 0) + 1
+            )
+            self._pool_key = pool_key
+        self._client = redis.Redis(connection_pool=pool)
 
     def _start_colab_redis(self):
         self._colab_redis = ColabRedis(self._port, self._redis_args)
@@ -174,40 +363,31 @@ class ReadyRedis:
             raise
 
     def _start_redis_container(self):
-        try:
-            # Try to find the docker-compose.yml file in the package
-            compose_file = (
-                importlib.resources.files("ready_redis") / "docker-compose.yml"
-            )
-            if not compose_file.is_file():
-                raise FileNotFoundError(
-                    f"docker-compose.yml not found at {compose_file}"
-                )
-        except ImportError:
-            # Fallback for development mode
-            current_dir = Path(__file__).parent.absolute()
-            project_root = current_dir.parent
-            compose_file = project_root / "docker-compose.yml"
+        already_running = self._reuse and self._container_running()
 
-        if not Path(compose_file).is_file():
-            raise FileNotFoundError(f"docker-compose.yml not found at {compose_file}")
+        compose_file_names = [_COMPOSE_FILE.name]
+        if self._use_push_readiness and not already_running:
+            self._open_ready_fifo()
+            compose_file_names.append(_PUSH_READY_COMPOSE_FILE.name)
 
-        self._env_file = tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".env"
-        )
-        self._env_file.write(f"PROJECT_NAME={self._name}\n")
-        self._env_file.write(f"REDIS_CONTAINER_NAME={self._redis_container_name}\n")
-        self._env_file.write(f"REDIS_VERSION={self._redis_version}\n")
-        self._env_file.write(f"REDIS_PORT={self._port}\n")
-        self._env_file.write(f"REDIS_ARGS={self._redis_args}\n")
-        self._env_file.flush()
+        fd, self._env_file_path = tempfile.mkstemp(suffix=".env")
+        try:
+            os.write(fd, self._env_file_contents().encode())
+        finally:
+            os.close(fd)
 
         self._compose = DockerCompose(
-            context=str(Path(compose_file).parent),
-            compose_file_name=Path(compose_file).name,
-            env_file=self._env_file.name,
+            context=str(_COMPOSE_FILE.parent),
+            compose_file_name=compose_file_names,
+            env_file=self._env_file_path,
         )
 
+        if already_running:
+            return
+
+        if _PREPULL_THREAD is not None:
+            _PREPULL_THREAD.join()
+
         try:
             self._compose.start()
         except subprocess.CalledProcessError as e:
@@ -216,35 +396,175 @@ class ReadyRedis:
                     f"Warning: Redis version {self._redis_version} not found. Falling back to latest."
                 )
                 self._redis_version = "latest"
-                self._env_file.seek(0)
-                self._env_file.write(f"REDIS_VERSION=latest\n")
-                self._env_file.truncate()
-                self._env_file.flush()
+                with open(self._env_file_path, "w") as env_file:
+                    env_file.write(self._env_file_contents())
                 self._compose.start()
             else:
                 raise
 
+        if self._use_push_readiness:
+            self._wait_push_ready()
+        else:
+            self._wait_container_healthy()
+
+    def _container_running(self):
+        result = subprocess.run(
+            [
+                "docker",
+                "inspect",
+                "-f",
+                "{{.State.Running}}",
+                self._redis_container_name,
+            ],
+            capture_output=True,
+            text=True,
+        )
+        return result.stdout.strip() == "true"
+
+    def _env_file_contents(self):
+        contents = (
+            f"PROJECT_NAME={self._name}\n"
+            f"REDIS_CONTAINER_NAME={self._redis_container_name}\n"
+            f"REDIS_VERSION={self._redis_version}\n"
+            f"REDIS_PORT={self._port}\n"
+            f"REDIS_ARGS={self._redis_args}\n"
+            f"REDIS_STOP_GRACE_PERIOD={self._stop_grace_period()}\n"
+        )
+        if self._ready_fifo_dir:
+            contents += f"READY_FIFO={self._ready_fifo_path()}\n"
+        return contents
+
+    def _stop_grace_period(self):
+        # Without persistence there is nothing to save on shutdown, so a short
+        # grace period avoids waiting on Docker's default 10s stop timeout
+        args = shlex.split(self._redis_args)
+        pairs = dict(zip(args, args[1:]))
+        persistence_disabled = (
+            pairs.get("--save") == "" and pairs.get("--appendonly", "no") == "no"
+        )
+        return "1s" if persistence_disabled else "10s"
+
+    def _ready_fifo_path(self):
+        return os.path.join(self._ready_fifo_dir, "ready.fifo")
+
+    def _open_ready_fifo(self):
+        self._ready_fifo_dir = tempfile.mkdtemp(prefix="ready-redis-")
+        os.mkfifo(self._ready_fifo_path(), 0o600)
+        # Non-blocking so the open does not wait for the container to connect
+        self._ready_fifo_fd = os.open(
+            self._ready_fifo_path(), os.O_RDONLY | os.O_NONBLOCK
+        )
+
+    def _wait_push_ready(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Redis container {self._redis_container_name} did not signal "
+                    f"readiness after {timeout} seconds"
+                )
+            readable, _, _ = select.select([self._ready_fifo_fd], [], [], remaining)
+            if not readable:
+                continue
+            try:
+                data = os.read(self._ready_fifo_fd, 64)
+            except BlockingIOError:
+                continue
+            if not data:
+                raise RuntimeError(
+                    f"Redis container {self._redis_container_name} closed the "
+                    "readiness pipe without signalling"
+                )
+            return
+
+    def _close_ready_fifo(self):
+        if self._ready_fifo_fd is not None:
+            os.close(self._ready_fifo_fd)
+            self._ready_fifo_fd = None
+        if self._ready_fifo_dir:
+            shutil.rmtree(self._ready_fifo_dir, ignore_errors=True)
+            self._ready_fifo_dir = None
+
+    def _wait_container_healthy(self, timeout=30):
+        deadline = time.monotonic() + timeout
+        while True:
+            result = subprocess.run(
+                [
+                    "docker",
+                    "inspect",
+                    "-f",
+                    "{{.State.Health.Status}}",
+                    self._redis_container_name,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            status = result.stdout.strip()
+            if status == "healthy":
+                return
+            if status == "unhealthy":
+                raise RuntimeError(
+                    f"Redis container {self._redis_container_name} is unhealthy"
+                )
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Redis container {self._redis_container_name} not healthy "
+                    f"after {timeout} seconds (last status: {status or 'unknown'})"
+                )
+            time.sleep(0.1)
+
     def cleanup(self):
         if self._cleaned_up:
             return
 
+        if self._atexit_registered:
+            atexit.unregister(self.cleanup)
+            self._atexit_registered = False
+
+        if self._config is not None:
+            with ReadyRedis._lock:
+                if ReadyRedis._instances.get(self._config) is self:
+                    del ReadyRedis._instances[self._config]
+
+        if self._pool_key is not None:
+            # The pool is shared per endpoint; only the last user disconnects it
+            pool = None
+            with ReadyRedis._lock:
+                users = ReadyRedis._pool_users.get(self._pool_key, 0) - 1
+                if users > 0:
+                    ReadyRedis._pool_users[self._pool_key] = users
+                else:
+                    ReadyRedis._pool_users.pop(self._pool_key, None)
+                    pool = ReadyRedis._pools.pop(self._pool_key, None)
+            self._pool_key = None
+            if pool is not None:
+                pool.disconnect()
+
         if self._colab_redis:
             print("Stopping Redis Stack in Google Colab environment...")
             self._colab_redis.stop()
             print("Redis Stack stopped.")
+        elif self._compose and self._reuse:
+            # Leave the container running; the env file is kept so the stack
+            # can still be stopped at exit when READY_REDIS_REUSE_AUTOSTOP=1
+            ReadyRedis._reused_stacks.append((self._compose, self._env_file_path))
+            self._env_file_path = None
         elif self._compose and sys.meta_path is not None:
             try:
                 self._compose.stop()
             except Exception as e:
                 print(f"Error during cleanup: {e}")
 
-        if self._env_file:
-            self._env_file.close()
+        if self._env_file_path:
             try:
-                os.unlink(self._env_file.name)
+                os.unlink(self._env_file_path)
             except FileNotFoundError:
                 pass
 
+        self._close_ready_fifo()
+
         self._cleaned_up = True
 
     def __del__(self):
@@ -258,14 +578,65 @@ class ReadyRedis:
 
     @classmethod
     def shutdown_all(cls):
-        for instance in cls._instances.values():
+        instances = list(cls._instances.values())
+        if len(instances) > 1:
+            try:
+                # Each cleanup shells out to docker, so stop the stacks concurrently
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(32, len(instances))
+                ) as executor:
+                    list(executor.map(lambda instance: instance.cleanup(), instances))
+            except RuntimeError:
+                # concurrent.futures refuses new work once the interpreter is
+                # shutting down, e.g. when called from an atexit hook
+                pass
+        # cleanup is idempotent, so this only stops what the pool did not reach
+        for instance in instances:
             instance.cleanup()
         cls._instances.clear()
 
+    @classmethod
+    def stop_reused_containers(cls):
+        """Stop reused containers whose instances have already been cleaned up."""
+        for compose, env_file_path in cls._reused_stacks:
+            try:
+                compose.stop()
+            except Exception as e:
+                print(f"Error during cleanup: {e}")
+            try:
+                os.unlink(env_file_path)
+            except FileNotFoundError:
+                pass
+        cls._reused_stacks.clear()
+
     @property
     def container_name(self):
         return self._redis_container_name
 
     @property
     def client(self):
+        # Only instances whose client is handed out need their own exit hook;
+        # instances still in the registry are covered by shutdown_all.
+        if not self._atexit_registered and not self._cleaned_up:
+            atexit.register(self.cleanup)
+            self._atexit_registered = True
         return self._client
+
+
+def _stop_reused_stacks():
+    if os.getenv("READY_REDIS_REUSE_AUTOSTOP") == "1":
+        ReadyRedis.stop_reused_containers()
+        return
+
+    for _, env_file_path in ReadyRedis._reused_stacks:
+        try:
+            os.unlink(env_file_path)
+        except FileNotFoundError:
+            pass
+    ReadyRedis._reused_stacks.clear()
+
+
+# atexit runs hooks in reverse order, so registry instances are cleaned up
+# first and hand reused stacks over to _stop_reused_stacks
+atexit.register(_stop_reused_stacks)
+atexit.register(ReadyRedis.shutdown_all)
@@ -1,5 +1,9 @@
+import subprocess
+import sys
+
 import pytest
 
+import ready_redis.ready_redis as ready_redis_module
 from ready_redis import ReadyRedis
 
 
@@ -44,15 +48,35 @@ def test_ready_redis_singleton():
         r1 is r2
     ), "ReadyRedis.get() should return the same instance for the same configuration"
 
-    # Verify that a different configuration returns a different instance
+    # The container name is not part of the configuration identity
     r3 = ReadyRedis.get(
         name=project_name, redis_container_name="different-container", port=port
     )
     assert (
-        r1 is not r3
+        r1 is r3
+    ), "ReadyRedis.get() should ignore the container name when looking up instances"
+    assert r3.container_name == container_name
+
+    # Verify that a different configuration returns a different instance
+    r4 = ReadyRedis.get(name=project_name, port=6384)
+    assert (
+        r1 is not r4
     ), "ReadyRedis.get() should return a different instance for a different configuration"
 
 
+def test_ready_redis_with_password():
+    """Test ReadyRedis with a server that requires authentication."""
+    with ReadyRedis.get(
+        port=6388,
+        password="secret",
+        redis_args="--save '' --appendonly no --requirepass secret",
+    ) as r:
+        assert r.ping()
+
+        r.set("foo", "bar")
+        assert r.get("foo") == b"bar"
+
+
 def test_ready_redis_with_custom_container_project_name():
     """Test ReadyRedis with a custom project name."""
     with ReadyRedis.get(name="bsb-playground") as r:
@@ -77,3 +101,87 @@ def test_manual_cleanup():
     assert r.client.ping()
 
     r.cleanup()
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="push readiness bind-mounts a FIFO, which needs a Linux Docker host",
+)
+def test_ready_redis_push_readiness():
+    """Test ReadyRedis waiting on the container's readiness signal."""
+    with ReadyRedis.get(port=6385, use_push_readiness=True) as r:
+        assert r.ping()
+
+        r.set("foo", "bar")
+        assert r.get("foo") == b"bar"
+
+
+def test_ready_redis_reuse():
+    """Test that a reusable container survives cleanup and is picked up again."""
+    try:
+        r1 = ReadyRedis.get(port=6386, reuse=True)
+        container_name = r1.container_name
+        r1.client.set("foo", "bar")
+        r1.cleanup()
+
+        r2 = ReadyRedis.get(port=6386, reuse=True)
+        assert r2 is not r1
+        assert r2.container_name == container_name
+        assert r2.client.get("foo") == b"bar"
+        r2.cleanup()
+    finally:
+        ReadyRedis.stop_reused_containers()
+
+
+def test_ready_redis_stopped_at_exit():
+    """Test that an instance whose client was never used is stopped at exit."""
+    container_name = "ready-redis-exit-test"
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from ready_redis import ReadyRedis; "
+            f"ReadyRedis.get(redis_container_name='{container_name}', port=6387)",
+        ],
+        check=True,
+    )
+
+    result = subprocess.run(
+        ["docker", "ps", "-aq", "--filter", f"name=^{container_name}$"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_shared_pool_survives_partial_cleanup(monkeypatch):
+    """Test that cleaning up one instance keeps the shared pool for the others."""
+    monkeypatch.setattr(ready_redis_module, "is_colab_environment", lambda: False)
+    monkeypatch.setattr(ready_redis_module, "_wait_ready", lambda *args: None)
+    monkeypatch.setattr(ReadyRedis, "_start_redis_container", lambda self: None)
+
+    args = ("127.0.0.1", 6389, 0, None, 3, "latest", "--save '' --appendonly no")
+    pool_key = ("127.0.0.1", 6389, 0, None, 3)
+
+    r1 = ReadyRedis("pool-a", "pool-a-redis", *args)
+    r2 = ReadyRedis("pool-b", "pool-b-redis", *args)
+    pool = ReadyRedis._pools[pool_key]
+    assert r1.client.connection_pool is pool
+    assert r2.client.connection_pool is pool
+    assert ReadyRedis._pool_users[pool_key] == 2
+
+    r1.cleanup()
+    assert ReadyRedis._pools[pool_key] is pool
+    assert ReadyRedis._pool_users[pool_key] == 1
+    assert r2.client.connection_pool is pool
+
+    # A new instance on the same endpoint joins the surviving pool
+    r3 = ReadyRedis("pool-c", "pool-c-redis", *args)
+    assert r3.client.connection_pool is pool
+    assert ReadyRedis._pool_users[pool_key] == 2
+
+    r2.cleanup()
+    r3.cleanup()
+    assert pool_key not in ReadyRedis._pools
+    assert pool_key not in ReadyRedis._pool_users